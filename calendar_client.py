@@ -6,8 +6,18 @@ If you get 401, Google may require OAuth for your account—see README.
 """
 
 import argparse
+import atexit
+import functools
+import json
+import os
+import re
+import sqlite3
 import sys
-from datetime import date, datetime, timedelta
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, datetime, time, timedelta, timezone
+from urllib.parse import quote
 
 try:
     from dotenv import load_dotenv
@@ -16,38 +26,108 @@ except ImportError:
 
 try:
     import caldav
+    from caldav.lib.error import AuthorizationError, DAVError
 except ImportError:
     caldav = None
+    AuthorizationError = DAVError = None
+
+try:
+    import icalendar
+except ImportError:
+    icalendar = None
+
+try:
+    from dateutil.rrule import rrulestr, rruleset
+except ImportError:
+    rrulestr = rruleset = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_config():
-    """Load Gmail user and app password from .env (same as mail_client)."""
+    """
+    Load Gmail user and app password from .env (same as mail_client).
+
+    Cached for the life of the process; call reload_config() to re-read.
+    """
     if load_dotenv:
         load_dotenv()
-    import os
     return {
         "user": os.environ.get("GMAIL_USER", "").strip(),
         "password": os.environ.get("GMAIL_APP_PASSWORD", "").replace(" ", "").strip(),
     }
 
 
-def _caldav_client(user=None, password=None):
-    """Build CalDAV client for Google. Uses legacy endpoint that accepts app password."""
+def reload_config():
+    """Drop the cached config so the next call re-reads the environment and .env."""
+    get_config.cache_clear()
+
+
+def _credentials(user=None, password=None):
+    """Resolve user and app password from args or .env."""
     cfg = get_config()
     user = user or cfg["user"]
     password = password or cfg["password"]
     if not user or not password:
         raise ValueError("GMAIL_USER and GMAIL_APP_PASSWORD are required (same as mail)")
+    return user, password
+
+
+_GOOGLE_CALDAV_URL = "https://calendar.google.com/calendar/dav/"
+
+# Google: .../calendar/dav/CALENDAR_ID/events -> CALENDAR_ID; otherwise the last path segment.
+_CAL_ID_RE = re.compile(r"([^/]+?)(?:/events)?/*$", re.IGNORECASE)
+
+# One DAVClient per account, reused so the HTTPS connection stays alive.
+_clients = {}
+
+
+def _caldav_client(user=None, password=None):
+    """Return the CalDAV client for Google. Uses legacy endpoint that accepts app password."""
+    user, password = _credentials(user, password)
     if not caldav:
         raise ImportError("Install caldav: pip install caldav")
 
+    client = _clients.get((user, password))
+    if client is not None:
+        return client
+
     # Google legacy CalDAV endpoint; same app password as IMAP/SMTP.
     # For primary calendar, calendar ID is the user's email.
-    url = "https://calendar.google.com/calendar/dav/"
-    client = caldav.DAVClient(url=url, username=user, password=password)
+    # Reusing the client per account keeps its HTTP session (and kept-alive connections).
+    client = caldav.DAVClient(url=_GOOGLE_CALDAV_URL, username=user, password=password)
+    _clients[(user, password)] = client
+    atexit.register(client.close)
     return client
 
 
+# Calendars already matched by id, keyed by (user, calendar_id).
+_calendar_by_id = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_principal(user, password):
+    """
+    Return (client, principal, calendars) for the account, cached per user.
+
+    principal() and calendars() each cost a round trip; doing them once per
+    process makes repeated list_calendars/list_events calls much cheaper.
+    """
+    client = _caldav_client(user=user, password=password)
+    principal = client.principal()
+    return client, principal, tuple(principal.calendars())
+
+
+def _clear_caldav_cache():
+    """Forget cached clients, principals and calendar lookups (for tests / credential changes)."""
+    _get_principal.cache_clear()
+    _calendar_by_id.clear()
+    for client in _clients.values():
+        atexit.unregister(client.close)
+        client.close()
+    _clients.clear()
+    _recur_cache.clear()
+
+
 def list_calendars(*, user=None, password=None):
     """
     List calendars the account can see via CalDAV.
@@ -56,9 +136,8 @@ def list_calendars(*, user=None, password=None):
     Note: Google only exposes shared calendars ("Other calendars") after you
     enable them at https://www.google.com/calendar/syncselect
     """
-    client = _caldav_client(user=user, password=password)
-    principal = client.principal()
-    calendars = principal.calendars()
+    user, password = _credentials(user, password)
+    _, _, calendars = _get_principal(user, password)
     result = []
     for cal in calendars:
         name = getattr(cal, "name", None) or ""
@@ -67,36 +146,235 @@ def list_calendars(*, user=None, password=None):
                 name = cal.get_display_name() or name
             except Exception:
                 pass
-        url = cal.url if hasattr(cal, "url") else ""
-        path_parts = url.rstrip("/").split("/")
-        # Google: .../calendar/dav/CALENDAR_ID/events -> id is second-to-last
-        if path_parts and path_parts[-1].lower() == "events":
-            cal_id = path_parts[-2] if len(path_parts) >= 2 else path_parts[-1]
-        else:
-            cal_id = path_parts[-1] if path_parts else ""
+        url = str(cal.url) if hasattr(cal, "url") else ""
+        m = _CAL_ID_RE.search(url)
+        cal_id = m.group(1) if m else url.rstrip("/").rsplit("/", 1)[-1]
         result.append({"name": name, "url": url, "id": cal_id})
     return result
 
 
-def list_events(
-    start=None,
-    end=None,
-    calendar_id=None,
-    *,
-    user=None,
-    password=None,
-    max_results=100,
-):
+def _ical_text(value):
+    """Decode an iCalendar text property to str ("" if missing)."""
+    if hasattr(value, "to_ical") and value:
+        return value.to_ical().decode("utf-8", errors="replace")
+    return str(value) if value else ""
+
+
+def _ical_dt(value):
+    """Return the date/datetime behind a DTSTART/DTEND property (or None)."""
+    if value is None:
+        return None
+    if hasattr(value, "dt"):
+        return value.dt
+    return value
+
+
+class _LazyEvent(Mapping):
     """
-    List events in a date range. Uses primary calendar if calendar_id is None.
+    Read-only event dict (summary, start, end, uid, location, description).
 
-    start/end: date or datetime; default last 7 days to next 30 days.
-    Returns list of dicts: summary, start, end, uid, location, description.
+    Wraps the parsed iCalendar component and decodes each field on first access,
+    so callers that only read summary/start pay nothing for the rest.
     """
-    client = _caldav_client(user=user, password=password)
-    cfg = get_config()
-    email = (user or cfg["user"]).strip()
 
+    __slots__ = ("_comp", "_cache")
+
+    _FIELDS = {
+        "summary": lambda comp: _ical_text(comp.get("summary", "")) or "(no title)",
+        "start": lambda comp: _ical_dt(comp.get("dtstart")),
+        "end": lambda comp: _ical_dt(comp.get("dtend")),
+        "uid": lambda comp: _ical_text(comp.get("uid", "")),
+        "location": lambda comp: _ical_text(comp.get("location", "")),
+        "description": lambda comp: _ical_text(comp.get("description", "")),
+    }
+
+    def __init__(self, comp, **fields):
+        self._comp = comp
+        # Pre-set fields (e.g. start/end of one occurrence of a recurring event)
+        self._cache = fields
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = self._cache[key] = self._FIELDS[key](self._comp)
+        return value
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+    def __repr__(self):
+        return "<event %r>" % self["summary"]
+
+    def _cache_entry(self):
+        """JSON-able form for the event cache: raw iCalendar text plus start/end."""
+        return {
+            "ical": self._comp.to_ical().decode("utf-8"),
+            "start": _dump_value(self["start"]),
+            "end": _dump_value(self["end"]),
+        }
+
+    @classmethod
+    def _from_cache_entry(cls, entry):
+        return cls(
+            icalendar.Event.from_ical(entry["ical"]),
+            start=_load_value(entry["start"]),
+            end=_load_value(entry["end"]),
+        )
+
+
+# Recurrence sets of recurring masters, keyed by (uid, last-modified, rule data).
+# dateutil caches generated occurrences, so shifting windows reuse earlier work.
+_recur_cache = {}
+
+
+def _ical_bytes(value):
+    if isinstance(value, list):
+        return b"|".join(_ical_bytes(v) for v in value)
+    return value.to_ical() if hasattr(value, "to_ical") else b""
+
+
+def _utc(value):
+    """Normalize a date / naive (local) / aware datetime to an aware UTC datetime."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return value.astimezone(timezone.utc)
+
+
+def _is_recurring(comp):
+    return any(comp.get(name) is not None for name in ("rrule", "rdate", "exrule"))
+
+
+def _rule_dt(value, base):
+    """Coerce an RDATE/EXDATE value to a datetime comparable with the rule's base."""
+    if isinstance(value, tuple):
+        value = value[0]  # RDATE period: (start, end or duration)
+    dt = value if isinstance(value, datetime) else datetime.combine(value, time())
+    if base.tzinfo is None and dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    elif base.tzinfo is not None and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=base.tzinfo)
+    return dt
+
+
+def _date_values(prop):
+    """Yield the date/datetime values of an RDATE/EXDATE property (single or repeated)."""
+    for p in prop if isinstance(prop, list) else [prop]:
+        for d in getattr(p, "dts", []):
+            yield d.dt
+
+
+def _recurrence(master):
+    """
+    Return (rruleset, dtstart, duration) for a recurring VEVENT master (RRULE and/or
+    RDATE, minus EXDATE), or None if the recurrence cannot be handled client-side.
+    """
+    dtstart = _ical_dt(master.get("dtstart"))
+    if rrulestr is None or not _is_recurring(master) or dtstart is None:
+        return None
+    if master.get("exrule") is not None:
+        return None
+    key = (
+        _ical_text(master.get("uid", "")),
+        _ical_bytes(master.get("last-modified")),
+        _ical_bytes(master.get("rrule")),
+        _ical_bytes(master.get("rdate")),
+        _ical_bytes(master.get("dtstart")),
+        _ical_bytes(master.get("exdate")),
+    )
+    if key in _recur_cache:
+        return _recur_cache[key]
+
+    dtend = _ical_dt(master.get("dtend"))
+    if dtend is not None:
+        duration = dtend - dtstart
+    elif master.get("duration") is not None:
+        duration = master["duration"].dt
+    else:
+        duration = timedelta(days=1) if not isinstance(dtstart, datetime) else timedelta(0)
+
+    base = dtstart if isinstance(dtstart, datetime) else datetime.combine(dtstart, time())
+    rrules = master.get("rrule")
+    try:
+        if rrules is not None:
+            rule_text = "\n".join(
+                "RRULE:" + r.to_ical().decode()
+                for r in (rrules if isinstance(rrules, list) else [rrules])
+            )
+            rset = rrulestr(rule_text, dtstart=base, forceset=True, cache=True)
+        else:
+            # RDATE only: DTSTART is the first instance
+            rset = rruleset(cache=True)
+            rset.rdate(base)
+        for value in _date_values(master.get("rdate") or []):
+            rset.rdate(_rule_dt(value, base))
+        for value in _date_values(master.get("exdate") or []):
+            rset.exdate(_rule_dt(value, base))
+    except (AttributeError, ValueError, TypeError):
+        return None
+    _recur_cache[key] = (rset, dtstart, duration)
+    return _recur_cache[key]
+
+
+def _overlaps(comp, window_start, window_end):
+    s = _ical_dt(comp.get("dtstart"))
+    if s is None:
+        return False
+    e = _ical_dt(comp.get("dtend")) or s
+    return _utc(s) < window_end and _utc(e) >= window_start
+
+
+def _occurrences(event, window_start, window_end):
+    """
+    Return a list of _LazyEvents, one per occurrence of a CalDAV event inside the
+    window, expanding recurring masters client-side (RECURRENCE-ID overrides win).
+
+    Returns None if the event recurs but its rule cannot be expanded here; the
+    caller should then let the server expand the calendar.
+    """
+    master = getattr(event, "component", None)
+    if not master:
+        return []
+    if not _is_recurring(master):
+        return [_LazyEvent(master)]
+    rec = _recurrence(master)
+    if rec is None:
+        return None
+
+    result = []
+    instance = getattr(event, "icalendar_instance", None)
+    overrides = [
+        c for c in (instance.walk("VEVENT") if instance is not None else [])
+        if c.get("recurrence-id") is not None
+    ]
+    replaced = set()
+    for o in overrides:
+        replaced.add(_utc(_ical_dt(o["recurrence-id"])))
+        if _overlaps(o, window_start, window_end):
+            result.append(_LazyEvent(o))
+
+    rset, dtstart, duration = rec
+    lo, hi = window_start - duration, window_end
+    if not isinstance(dtstart, datetime) or dtstart.tzinfo is None:
+        # naive rule: compare in local wall-clock time
+        lo = lo.astimezone().replace(tzinfo=None)
+        hi = hi.astimezone().replace(tzinfo=None)
+    for occ in rset.between(lo, hi, inc=True):
+        if _utc(occ) in replaced:
+            continue
+        occ_start = occ if isinstance(dtstart, datetime) else occ.date()
+        result.append(_LazyEvent(master, start=occ_start, end=occ_start + duration))
+    return result
+
+
+def _date_range(start, end):
+    """Apply the default window and convert to dates (caldav search() accepts either)."""
     if start is None:
         start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=7)
     if end is None:
@@ -107,66 +385,249 @@ def list_events(
         start = start.date() if hasattr(start, "date") else start
     if isinstance(end, datetime):
         end = end.date() if hasattr(end, "date") else end
+    return start, end
 
-    principal = client.principal()
-    calendars = principal.calendars()
 
-    # Pick calendar: by id (e.g. user@gmail.com or xxx@group.calendar.google.com) or first
-    calendar = None
-    if calendar_id:
+def _find_calendar(user, calendars, calendar_id):
+    """Find a calendar by id (e.g. user@gmail.com or xxx@group.calendar.google.com)."""
+    calendar = _calendar_by_id.get((user, calendar_id))
+    if calendar is None:
         for cal in calendars:
-            url = getattr(cal, "url", "") or ""
+            url = str(getattr(cal, "url", "") or "")
             if calendar_id in url or url.rstrip("/").endswith(calendar_id):
-                calendar = cal
+                calendar = _calendar_by_id[(user, calendar_id)] = cal
                 break
-    if not calendar and calendars:
-        calendar = calendars[0]
-    if not calendar:
-        return []
+    return calendar
+
+
+def _direct_calendar(user, password, calendar_id):
+    """
+    Return the Calendar for a known Google calendar id, built straight from its URL
+    (.../calendar/dav/CALENDAR_ID/events/) so no principal/calendars PROPFIND is needed.
+    """
+    calendar = _calendar_by_id.get((user, calendar_id))
+    if calendar is None:
+        client = _caldav_client(user=user, password=password)
+        url = "%s%s/events/" % (_GOOGLE_CALDAV_URL, quote(calendar_id, safe="@%"))
+        calendar = _calendar_by_id[(user, calendar_id)] = caldav.Calendar(client=client, url=url)
+    return calendar
+
+
+def _sort_by_start(events, window_start):
+    """Sort events in place by start; events without a start sort at window_start."""
+    events.sort(key=lambda ev: _utc(ev["start"]) if ev["start"] is not None else window_start)
+    return events
+
+
+def _search_calendar(calendar, start, end, max_results, expand):
+    """Run one calendar's date-range search and wrap the results as _LazyEvents."""
+    if not expand and rrulestr is not None:
+        events = calendar.search(start=start, end=end, event=True, expand=False)
+        window_start, window_end = _utc(start), _utc(end)
+        result = []
+        for e in events:
+            occurrences = _occurrences(e, window_start, window_end)
+            if occurrences is None:
+                # A rule dateutil cannot handle: let the server expand this calendar.
+                return _search_calendar(calendar, start, end, max_results, True)
+            result.extend(occurrences)
+        return _sort_by_start(result, window_start)[:max_results]
 
     events = calendar.search(start=start, end=end, event=True, expand=True)
     result = []
-    for e in events[:max_results]:
+    for e in events:
         comp = getattr(e, "component", None)
         if not comp:
             continue
-        s = comp.get("summary", "") or ""
-        if hasattr(s, "to_ical"):
-            summary = s.to_ical().decode("utf-8", errors="replace")
-        else:
-            summary = str(s)
-        uid = comp.get("uid", "")
-        if hasattr(uid, "to_ical"):
-            uid = uid.to_ical().decode("utf-8", errors="replace")
-        dt_start = comp.get("dtstart")
-        dt_end = comp.get("dtend")
-        loc = comp.get("location", "")
-        if hasattr(loc, "to_ical") and loc:
-            loc = loc.to_ical().decode("utf-8", errors="replace")
-        else:
-            loc = str(loc) if loc else ""
-        desc = comp.get("description", "")
-        if hasattr(desc, "to_ical") and desc:
-            desc = desc.to_ical().decode("utf-8", errors="replace")
-        else:
-            desc = str(desc) if desc else ""
-
-        def _dt(d):
-            if d is None:
-                return None
-            if hasattr(d, "dt"):
-                return d.dt
-            return d
-
-        result.append({
-            "summary": summary or "(no title)",
-            "start": _dt(dt_start),
-            "end": _dt(dt_end),
-            "uid": uid,
-            "location": loc,
-            "description": desc,
-        })
-    return result
+        result.append(_LazyEvent(comp))
+    # Server order is unspecified: sort before trimming so max_results keeps the earliest.
+    return _sort_by_start(result, _utc(start))[:max_results]
+
+
+# On-disk cache of listed events, shared across processes (CLI runs, polling loops).
+_EVENT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "simplemail", "events.sqlite3")
+
+
+def _event_cache_db():
+    os.makedirs(os.path.dirname(_EVENT_CACHE_PATH), mode=0o700, exist_ok=True)
+    db = sqlite3.connect(_EVENT_CACHE_PATH, timeout=5)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS events "
+        "(user TEXT, calendar TEXT, expand INTEGER, start TEXT, end TEXT, fetched REAL, data TEXT)"
+    )
+    return db
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])
+        return date.fromisoformat(value["date"])
+    return value
+
+
+def _cached_search(user, calendar, start, end, max_results, expand, cache_ttl):
+    """
+    _search_calendar with a TTL cache keyed by (user, calendar, window).
+
+    A fresh entry whose window covers [start, end] is reused and filtered to the
+    requested window, so narrower or repeated queries make no network calls.
+    Entries hold each event's raw iCalendar text, so hits and misses both return
+    _LazyEvents and fields are still decoded only on access.
+    """
+    if not cache_ttl or icalendar is None:
+        return _search_calendar(calendar, start, end, max_results, expand)
+    cal_key = str(getattr(calendar, "url", "") or "")
+    now = datetime.now().timestamp()
+    window_start, window_end = _utc(start), _utc(end)
+    try:
+        db = _event_cache_db()
+    except (OSError, sqlite3.Error):
+        return _search_calendar(calendar, start, end, max_results, expand)
+    with closing(db):
+        row = db.execute(
+            "SELECT data FROM events WHERE user = ? AND calendar = ? AND expand = ? "
+            "AND start <= ? AND end >= ? AND fetched >= ? ORDER BY fetched DESC LIMIT 1",
+            (user, cal_key, int(expand), start.isoformat(), end.isoformat(), now - cache_ttl),
+        ).fetchone()
+        if row:
+            try:
+                cached = [_LazyEvent._from_cache_entry(item) for item in json.loads(row[0])]
+            except (KeyError, TypeError, ValueError):
+                cached = None  # unreadable entry: treat as a miss
+            if cached is not None:
+                result = []
+                for ev in cached:
+                    ev_start = ev["start"]
+                    if ev_start is not None:
+                        ev_end = ev["end"] or ev_start
+                        if _utc(ev_start) >= window_end or _utc(ev_end) < window_start:
+                            continue
+                    result.append(ev)
+                return result[:max_results]
+
+        result = _search_calendar(calendar, start, end, None, expand)
+        try:
+            data = json.dumps([ev._cache_entry() for ev in result])
+            db.execute("DELETE FROM events WHERE fetched < ?", (now - cache_ttl,))
+            db.execute(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (user, cal_key, int(expand), start.isoformat(), end.isoformat(), now, data),
+            )
+            db.commit()
+        except (AttributeError, TypeError, ValueError, sqlite3.Error):
+            pass
+    return result[:max_results]
+
+
+def _search_by_id(user, password, calendar_id, start, end, max_results, expand, cache_ttl):
+    """
+    Search the calendar with this id; None if no visible calendar matches.
+
+    Complete ids (containing @) are tried at their direct URL first. Partial ids, and
+    direct URLs the server rejects for any reason other than auth, use discovery.
+    """
+    if "@" in calendar_id:
+        calendar = _direct_calendar(user, password, calendar_id)
+        try:
+            return _cached_search(user, calendar, start, end, max_results, expand, cache_ttl)
+        except DAVError as exc:
+            if isinstance(exc, AuthorizationError):
+                raise
+            _calendar_by_id.pop((user, calendar_id), None)
+    _, _, calendars = _get_principal(user, password)
+    calendar = _find_calendar(user, calendars, calendar_id)
+    if calendar is None:
+        return None
+    return _cached_search(user, calendar, start, end, max_results, expand, cache_ttl)
+
+
+def list_events(
+    start=None,
+    end=None,
+    calendar_id=None,
+    *,
+    user=None,
+    password=None,
+    max_results=100,
+    expand=False,
+    cache_ttl=60,
+):
+    """
+    List events in a date range. Uses primary calendar if calendar_id is None.
+
+    start/end: date or datetime; default last 7 days to next 30 days.
+    expand: let the server expand recurring events. By default recurrences are
+    expanded client-side (cached per event) and results are sorted by start.
+    cache_ttl: seconds to reuse results from the on-disk event cache (0 disables).
+    Returns list of read-only dicts: summary, start, end, uid, location, description.
+    Fields are decoded from the iCalendar data on first access.
+    """
+    user, password = _credentials(user, password)
+    start, end = _date_range(start, end)
+    if calendar_id:
+        events = _search_by_id(
+            user, password, calendar_id, start, end, max_results, expand, cache_ttl
+        )
+        if events is not None:
+            return events
+    _, _, calendars = _get_principal(user, password)
+
+    # Unknown (or no) id: use the first calendar
+    if not calendars:
+        return []
+    return _cached_search(user, calendars[0], start, end, max_results, expand, cache_ttl)
+
+
+def list_events_all(
+    start=None,
+    end=None,
+    calendar_ids=None,
+    *,
+    user=None,
+    password=None,
+    max_results=100,
+    expand=False,
+    cache_ttl=60,
+    max_workers=8,
+):
+    """
+    List events across several calendars (all visible calendars if calendar_ids is None).
+
+    Calendars are searched concurrently, so wall time is roughly that of the slowest
+    calendar rather than the sum. Unknown ids are skipped. Results are merged and
+    sorted by start; other arguments are as for list_events.
+    """
+    user, password = _credentials(user, password)
+    start, end = _date_range(start, end)
+    if calendar_ids is None:
+        _, _, calendars = _get_principal(user, password)
+
+        def search(cal):
+            return _cached_search(user, cal, start, end, max_results, expand, cache_ttl)
+    else:
+        calendars = list(calendar_ids)
+
+        def search(cid):
+            events = _search_by_id(
+                user, password, cid, start, end, max_results, expand, cache_ttl
+            )
+            return events or []
+    if not calendars:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(search, cal) for cal in calendars]
+        result = [ev for f in futures for ev in f.result()]
+    return _sort_by_start(result, _utc(start))[:max_results]
 
 
 def main():
@@ -182,6 +643,8 @@ def main():
 
     p_events = sub.add_parser("events", help="List events in date range")
     p_events.add_argument("--calendar", dest="calendar_id", help="Calendar ID (default: primary)")
+    p_events.add_argument("--all", action="store_true", help="List events from all calendars")
+    p_events.add_argument("--no-cache", action="store_true", help="Bypass the 60s event cache")
     p_events.add_argument("--days-past", type=int, default=7, help="Days in the past to include")
     p_events.add_argument("--days-ahead", type=int, default=30, help="Days ahead to include")
     p_events.add_argument("--max", type=int, default=50, help="Max events to return")
@@ -208,14 +671,25 @@ def main():
         elif args.command == "events":
             start = datetime.now() - timedelta(days=args.days_past)
             end = datetime.now() + timedelta(days=args.days_ahead)
-            events = list_events(
-                start=start,
-                end=end,
-                calendar_id=args.calendar_id,
-                user=user,
-                password=password,
-                max_results=args.max,
-            )
+            if args.all:
+                events = list_events_all(
+                    start=start,
+                    end=end,
+                    user=user,
+                    password=password,
+                    max_results=args.max,
+                    cache_ttl=0 if args.no_cache else 60,
+                )
+            else:
+                events = list_events(
+                    start=start,
+                    end=end,
+                    calendar_id=args.calendar_id,
+                    user=user,
+                    password=password,
+                    max_results=args.max,
+                    cache_ttl=0 if args.no_cache else 60,
+                )
             for e in events:
                 start_str = e["start"] if e["start"] is None else str(e["start"])
                 end_str = e["end"] if e["end"] is None else str(e["end"])
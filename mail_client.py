@@ -5,13 +5,24 @@ Uses Google IMAP/SMTP with app password. Config from .env or CLI params.
 """
 
 import argparse
+import atexit
+import binascii
+import codecs
 import email
+import functools
 import imaplib
+import quopri
+import re
 import smtplib
 import ssl
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.parser import BytesHeaderParser
 
 try:
     from dotenv import load_dotenv
@@ -19,8 +30,14 @@ except ImportError:
     load_dotenv = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_from_env():
-    """Load config from environment (after loading .env if dotenv is available)."""
+    """
+    Load config from environment (after loading .env if dotenv is available).
+
+    The result is cached for the life of the process; call reload_config() after
+    changing the environment or .env.
+    """
     if load_dotenv:
         load_dotenv()
     import os
@@ -34,6 +51,44 @@ def get_config_from_env():
     }
 
 
+def reload_config():
+    """Drop the cached config so the next call re-reads the environment and .env."""
+    get_config_from_env.cache_clear()
+
+
+# Shared TLS context: loading the system CA bundle once instead of per connection.
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+def _smtp_settings(user, password, smtp_host, smtp_port):
+    cfg = get_config_from_env()
+    user = user or cfg["user"]
+    password = password or cfg["password"]
+    smtp_host = smtp_host or cfg["smtp_host"]
+    smtp_port = smtp_port or cfg["smtp_port"]
+    if not user or not password:
+        raise ValueError("Gmail user and app password are required (set GMAIL_USER and GMAIL_APP_PASSWORD)")
+    return user, password, smtp_host, smtp_port
+
+
+def _build_message(to_addrs, subject, body, from_addr, body_html=None):
+    """Return (recipient list, MIME message)."""
+    if isinstance(to_addrs, str):
+        to_addrs = [to_addrs]
+
+    if body_html:
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(body, "plain"))
+        msg.attach(MIMEText(body_html, "html"))
+    else:
+        msg = MIMEText(body, "plain")
+
+    msg["Subject"] = subject
+    msg["From"] = from_addr
+    msg["To"] = ", ".join(to_addrs)
+    return to_addrs, msg
+
+
 def send_email(
     to_addrs,
     subject,
@@ -57,35 +112,43 @@ def send_email(
         from_addr: Sender (defaults to user).
         body_html: Optional HTML body (multipart if provided).
     """
-    cfg = get_config_from_env()
-    user = user or cfg["user"]
-    password = password or cfg["password"]
-    smtp_host = smtp_host or cfg["smtp_host"]
-    smtp_port = smtp_port or cfg["smtp_port"]
-    from_addr = from_addr or user
-
-    if not user or not password:
-        raise ValueError("Gmail user and app password are required (set GMAIL_USER and GMAIL_APP_PASSWORD)")
-
-    if isinstance(to_addrs, str):
-        to_addrs = [to_addrs]
-
-    if body_html:
-        msg = MIMEMultipart("alternative")
-        msg.attach(MIMEText(body, "plain"))
-        msg.attach(MIMEText(body_html, "html"))
-    else:
-        msg = MIMEText(body, "plain")
+    send_many(
+        [{"to": to_addrs, "subject": subject, "body": body, "body_html": body_html}],
+        user=user,
+        password=password,
+        smtp_host=smtp_host,
+        smtp_port=smtp_port,
+        from_addr=from_addr,
+    )
+
+
+def send_many(
+    messages,
+    *,
+    user=None,
+    password=None,
+    smtp_host=None,
+    smtp_port=None,
+    from_addr=None,
+):
+    """
+    Send several emails over one SMTP connection (one STARTTLS + login per batch).
 
-    msg["Subject"] = subject
-    msg["From"] = from_addr
-    msg["To"] = ", ".join(to_addrs)
+    Args:
+        messages: Iterable of dicts with keys to, subject, body and optional body_html.
+        user, password, smtp_host, smtp_port, from_addr: As for send_email.
+    """
+    user, password, smtp_host, smtp_port = _smtp_settings(user, password, smtp_host, smtp_port)
+    from_addr = from_addr or user
 
-    context = ssl.create_default_context()
     with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls(context=context)
+        server.starttls(context=_SSL_CONTEXT)
         server.login(user, password)
-        server.sendmail(from_addr, to_addrs, msg.as_string())
+        for m in messages:
+            to_addrs, msg = _build_message(
+                m["to"], m["subject"], m["body"], from_addr, m.get("body_html")
+            )
+            server.sendmail(from_addr, to_addrs, msg.as_string())
 
 
 def _imap_connection(user=None, password=None, imap_host=None, imap_port=None):
@@ -96,9 +159,384 @@ def _imap_connection(user=None, password=None, imap_host=None, imap_port=None):
     imap_port = imap_port or cfg["imap_port"]
     if not user or not password:
         raise ValueError("Gmail user and app password are required")
-    imap = imaplib.IMAP4_SSL(imap_host, imap_port)
-    imap.login(user, password)
-    return imap
+    return _imap_pool.acquire(user, password, imap_host, imap_port)
+
+
+class _IMAP4_SSL(imaplib.IMAP4_SSL):
+    """
+    IMAP4_SSL that also records untagged EXISTS/EXPUNGE responses in arrival order.
+
+    imaplib files untagged responses per type, which loses their relative order;
+    the pool needs it to keep a selected folder's message count current.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.mailbox_events = []
+        super().__init__(*args, **kwargs)
+
+    def _append_untagged(self, typ, dat):
+        if typ in ("EXISTS", "EXPUNGE"):
+            self.mailbox_events.append((typ, dat))
+        super()._append_untagged(typ, dat)
+
+
+class _IMAPPool:
+    """
+    Process-wide pool of logged-in IMAP connections, keyed by (user, host, port).
+
+    acquire() hands a connection to one caller at a time (imaplib is not thread-safe);
+    concurrent callers get separate connections. Idle connections are checked with
+    NOOP before reuse and logged out at exit. The selected folder is remembered so
+    repeated calls skip a redundant SELECT.
+    """
+
+    connection_class = _IMAP4_SSL
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._live = {}  # id(imap) -> (key, imap), idle or in use
+        self._idle = {}  # key -> [imap]
+        self._selected = {}
+        self._exists = {}
+
+    def acquire(self, user, password, host, port):
+        key = (user, host, port)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                imap = idle.pop() if idle else None
+            if imap is None:
+                break
+            try:
+                imap.noop()
+                return imap
+            except (imaplib.IMAP4.error, OSError):
+                self.discard(imap)
+        imap = self.connection_class(host, port, ssl_context=_SSL_CONTEXT)
+        imap.login(user, password)
+        with self._lock:
+            self._live[id(imap)] = (key, imap)
+        return imap
+
+    def release(self, imap):
+        """Return an acquired connection to the pool (no-op if it was discarded)."""
+        with self._lock:
+            entry = self._live.get(id(imap))
+            if entry is not None:
+                self._idle.setdefault(entry[0], []).append(imap)
+
+    def select(self, imap, folder, readonly):
+        """
+        SELECT (or EXAMINE) folder unless it is already the current one.
+
+        Returns the folder's message count (EXISTS), kept current from untagged
+        EXISTS/EXPUNGE responses seen since the SELECT, or None if SELECT failed.
+        """
+        if self._selected.get(id(imap)) == (folder, readonly):
+            count = self._exists[id(imap)]
+            for typ, dat in self._take_mailbox_events(imap):
+                if typ == "EXISTS":
+                    count = int(dat)
+                else:
+                    count -= 1  # each EXPUNGE removes one message
+            self._exists[id(imap)] = count
+            return count
+        status, data = imap.select(folder, readonly=readonly)
+        # The SELECT's own EXISTS is already in data; start tracking afresh.
+        self._take_mailbox_events(imap)
+        if status == "OK":
+            self._selected[id(imap)] = (folder, readonly)
+            self._exists[id(imap)] = int(data[0] or 0)
+            return self._exists[id(imap)]
+        self._selected.pop(id(imap), None)
+        return None
+
+    @staticmethod
+    def _take_mailbox_events(imap):
+        """Return and clear the EXISTS/EXPUNGE responses received since the last call."""
+        imap.untagged_responses.pop("EXISTS", None)
+        imap.untagged_responses.pop("EXPUNGE", None)
+        events, imap.mailbox_events = imap.mailbox_events, []
+        return events
+
+    def discard(self, imap):
+        """Drop a connection that may be in a bad state."""
+        with self._lock:
+            entry = self._live.pop(id(imap), None)
+            if entry is not None:
+                idle = self._idle.get(entry[0], [])
+                idle[:] = [conn for conn in idle if conn is not imap]
+            self._selected.pop(id(imap), None)
+            self._exists.pop(id(imap), None)
+        try:
+            imap.logout()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self._lock:
+            conns = [imap for _, imap in self._live.values()]
+        for imap in conns:
+            self.discard(imap)
+
+
+_imap_pool = _IMAPPool()
+atexit.register(_imap_pool.close_all)
+
+
+# charset -> codec decode function, so bulk header decoding resolves each codec once
+_codec_cache = {}
+
+
+def _codec_decoder(charset):
+    decode = _codec_cache.get(charset)
+    if decode is None:
+        try:
+            decode = codecs.lookup(charset).decode
+        except LookupError:
+            decode = codecs.lookup("utf-8").decode
+        _codec_cache[charset] = decode
+    return decode
+
+
+def _decode_header(value):
+    """Decode an RFC 2047 encoded header (Subject, From, ...) to str."""
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, UnicodeDecodeError, HeaderParseError):
+        # Unknown or lying charset: decode chunk by chunk, replacing bad bytes.
+        return "".join(
+            _codec_decoder(enc or "utf-8")(s, "replace")[0] if isinstance(s, bytes) else s
+            for s, enc in decode_header(value)
+        )
+
+
+# Header-only parser: stops at the header/body boundary.
+_header_parser = BytesHeaderParser()
+
+_FETCH_UID_RE = re.compile(rb"\bUID (\d+)")
+
+# Listing needs only the UID, flags and these headers. BODY.PEEK keeps \Seen
+# untouched even on a read-write SELECT.
+_LIST_FETCH_SPEC = "(UID FLAGS BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)])"
+
+
+def _split_fetch_response(msg_data):
+    """
+    Group a multi-message UID FETCH response by UID.
+
+    imaplib returns a flat list: a (prefix, literal) tuple per message, followed by
+    bytes trailers (Gmail often puts FLAGS there). Returns {uid: (flags, raw)} where
+    flags is the text inside FLAGS (...).
+    """
+    entries = []
+    for part in msg_data:
+        if isinstance(part, tuple):
+            entries.append(([part[0]], part[1] if len(part) > 1 else b""))
+        elif isinstance(part, bytes) and entries:
+            entries[-1][0].append(part)
+    messages = {}
+    for meta_parts, raw in entries:
+        meta = b"".join(meta_parts)
+        m = _FETCH_UID_RE.search(meta)
+        if not m:
+            continue
+        flags = b""
+        start = meta.find(b"FLAGS (")
+        if start >= 0:
+            start += len(b"FLAGS (")
+            end = meta.find(b")", start)
+            flags = meta[start:end] if end >= 0 else meta[start:]
+        messages[m.group(1).decode()] = (flags, raw)
+    return messages
+
+
+def _parse_imap_value(data, pos=0):
+    """
+    Parse one IMAP value (list, quoted string, literal, NIL or atom) at data[pos:].
+
+    Returns (value, end_pos). Lists become Python lists, NIL becomes None and
+    everything else bytes. Atoms may contain bracketed sections with spaces,
+    e.g. BODY[HEADER.FIELDS (SUBJECT FROM)].
+    """
+    while data[pos:pos + 1] == b" ":
+        pos += 1
+    c = data[pos:pos + 1]
+    if c == b"(":
+        items = []
+        pos += 1
+        while pos < len(data):
+            while data[pos:pos + 1] == b" ":
+                pos += 1
+            if data[pos:pos + 1] == b")":
+                return items, pos + 1
+            value, pos = _parse_imap_value(data, pos)
+            items.append(value)
+        return items, pos
+    if c == b'"':
+        out = bytearray()
+        pos += 1
+        while pos < len(data) and data[pos:pos + 1] != b'"':
+            if data[pos:pos + 1] == b"\\":
+                pos += 1
+            out += data[pos:pos + 1]
+            pos += 1
+        return bytes(out), pos + 1
+    if c == b"{":
+        close = data.index(b"}", pos)
+        size = int(data[pos + 1:close])
+        start = close + 3  # skip "}\r\n"
+        return data[start:start + size], start + size
+    start = pos
+    depth = 0
+    while pos < len(data):
+        ch = data[pos:pos + 1]
+        if ch == b"[":
+            depth += 1
+        elif ch == b"]":
+            depth -= 1
+        elif depth == 0 and ch in (b" ", b"(", b")"):
+            break
+        pos += 1
+    if pos == start:
+        return None, pos + 1
+    atom = data[start:pos]
+    return (None if atom.upper() == b"NIL" else atom), pos
+
+
+def _fetch_items(msg_data, uid):
+    """
+    Parse a UID FETCH response for one message into {ITEM_NAME: value}.
+
+    imaplib splits literals into (prefix, literal) tuples; they are stitched back
+    into one buffer, then each FETCH response in it is parsed in turn. imaplib also
+    returns unsolicited FETCHes queued earlier (e.g. FLAGS updates seen by a pooled
+    connection's NOOP), so only the response whose UID matches is returned.
+    """
+    data = b""
+    for part in msg_data:
+        if isinstance(part, tuple):
+            data += part[0] + b"\r\n" + (part[1] if len(part) > 1 else b"")
+        elif isinstance(part, bytes):
+            data += part
+    uid = str(uid).encode()
+    pos = data.find(b"(")
+    while pos >= 0:
+        items, pos = _parse_imap_value(data, pos)
+        fields = {
+            items[i].upper(): items[i + 1]
+            for i in range(0, len(items) - 1, 2)
+            if isinstance(items[i], bytes)
+        }
+        if fields.get(b"UID") == uid:
+            return fields
+        pos = data.find(b"(", pos)
+    return {}
+
+
+def _find_text_parts(structure, section=""):
+    """
+    Walk a parsed BODYSTRUCTURE and locate the first text/plain and text/html parts.
+
+    Returns {content_type: (section, encoding, charset)}. Attachments and the
+    contents of attached messages (message/rfc822) are skipped.
+    """
+    found = {}
+    if not isinstance(structure, list) or not structure:
+        return found
+    if isinstance(structure[0], list):
+        # multipart: child parts first, then the subtype and extension data
+        for i, child in enumerate(structure):
+            if not isinstance(child, list):
+                break
+            child_section = "%s.%d" % (section, i + 1) if section else str(i + 1)
+            for ctype, info in _find_text_parts(child, child_section).items():
+                found.setdefault(ctype, info)
+        return found
+    if len(structure) < 7 or not isinstance(structure[0], bytes) or not isinstance(structure[1], bytes):
+        return found
+    ctype = (structure[0] + b"/" + structure[1]).decode("ascii", errors="replace").lower()
+    if ctype not in ("text/plain", "text/html"):
+        return found
+    # text parts: type, subtype, params, id, desc, encoding, size, lines, md5, disposition
+    disposition = structure[9] if len(structure) > 9 else None
+    if isinstance(disposition, list) and disposition and isinstance(disposition[0], bytes):
+        if disposition[0].lower() == b"attachment":
+            return found
+    charset = None
+    params = structure[2] if isinstance(structure[2], list) else []
+    for i in range(0, len(params) - 1, 2):
+        if isinstance(params[i], bytes) and params[i].lower() == b"charset" and params[i + 1]:
+            charset = params[i + 1].decode("ascii", errors="replace")
+    encoding = structure[5].decode("ascii", errors="replace").lower() if structure[5] else ""
+    found[ctype] = (section or "1", encoding, charset)
+    return found
+
+
+def _text_bodies(msg, found=None):
+    """
+    Return (body_plain, body_html) from the first text/plain and text/html parts of a
+    parsed multipart message. Only multipart containers are descended into; attached
+    messages and non-text leaves are skipped, and the walk stops once both are found.
+    """
+    if found is None:
+        found = {}
+    for part in msg.get_payload():
+        if part.get_content_maintype() == "multipart":
+            _text_bodies(part, found)
+        elif part.get_content_maintype() == "text" and part.get_content_disposition() != "attachment":
+            ctype = part.get_content_type()
+            if ctype in ("text/plain", "text/html") and ctype not in found:
+                payload = part.get_payload(decode=True) or b""
+                found[ctype] = payload.decode(errors="replace")
+        if len(found) == 2:
+            break
+    return found.get("text/plain", ""), found.get("text/html", "")
+
+
+def _decode_part(data, encoding, charset):
+    """Undo the transfer encoding of a fetched body part and decode it to str."""
+    if encoding == "base64":
+        try:
+            data = binascii.a2b_base64(data)
+        except binascii.Error:
+            pass
+    elif encoding == "quoted-printable":
+        data = quopri.decodestring(data)
+    try:
+        return data.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return data.decode("utf-8", errors="replace")
+
+
+def _list_folder(imap, folder, max_count):
+    """List the newest max_count messages of folder on an acquired connection."""
+    total = _imap_pool.select(imap, folder, readonly=True)
+    if not total or max_count <= 0:
+        return []
+    # Fetch the last max_count messages by sequence number instead of searching the
+    # whole folder for UIDs; "*" keeps the range valid if the count is slightly stale.
+    first = max(1, total - max_count + 1)
+    status, msg_data = imap.fetch("%d:*" % first, _LIST_FETCH_SPEC)
+    if status != "OK" or not msg_data:
+        return []
+    messages = _split_fetch_response(msg_data)
+    result = []
+    # Newest first (UIDs ascend with arrival)
+    for uid in sorted(messages, key=int, reverse=True)[:max_count]:
+        flags, raw = messages[uid]
+        if raw:
+            msg = _header_parser.parsebytes(raw)
+            subj_str = _decode_header(msg.get("Subject", ""))
+            from_str = _decode_header(msg.get("From", ""))
+            result.append({
+                "uid": uid,
+                "subject": subj_str,
+                "from_addr": from_str,
+                "date": msg.get("Date", ""),
+                "seen": b"\\Seen" in flags,
+            })
+    return result
 
 
 def check_mailbox(
@@ -117,57 +555,48 @@ def check_mailbox(
     """
     imap = _imap_connection(user=user, password=password, imap_host=imap_host, imap_port=imap_port)
     try:
-        imap.select(folder, readonly=True)
-        status, data = imap.uid("search", None, "ALL")
-        if status != "OK":
-            return []
-        uid_list = data[0].split()
-        if not uid_list:
-            return []
-        # Fetch from newest; limit to max_count (UIDs are roughly ascending, newest last)
-        uid_list = uid_list[-max_count:][::-1]
-        result = []
-        for uid_bytes in uid_list:
-            uid = uid_bytes.decode()
-            status, msg_data = imap.uid("fetch", uid_bytes, "(RFC822 FLAGS)")
-            if status != "OK" or not msg_data:
-                continue
-            # Gmail returns FLAGS in a separate response part; collect all to detect \\Seen
-            flags = b""
-            raw = b""
-            for part in msg_data:
-                if isinstance(part, tuple):
-                    if isinstance(part[0], bytes):
-                        flags += part[0]
-                    raw = part[1] if len(part) > 1 else b""
-                elif isinstance(part, bytes):
-                    flags += part
-            if raw:
-                msg = email.message_from_bytes(raw)
-                subject = email.header.decode_header(msg.get("Subject", ""))
-                subj_str = ""
-                for s, enc in subject:
-                    if isinstance(s, bytes):
-                        subj_str += s.decode(enc or "utf-8", errors="replace")
-                    else:
-                        subj_str += s or ""
-                from_h = email.header.decode_header(msg.get("From", ""))
-                from_str = ""
-                for s, enc in from_h:
-                    if isinstance(s, bytes):
-                        from_str += s.decode(enc or "utf-8", errors="replace")
-                    else:
-                        from_str += s or ""
-                result.append({
-                    "uid": uid,
-                    "subject": subj_str,
-                    "from_addr": from_str,
-                    "date": msg.get("Date", ""),
-                    "seen": b"\\Seen" in flags,
-                })
-        return result
+        return _list_folder(imap, folder, max_count)
+    except Exception:
+        _imap_pool.discard(imap)
+        raise
     finally:
-        imap.logout()
+        _imap_pool.release(imap)
+
+
+def check_mailboxes(
+    folders,
+    *,
+    user=None,
+    password=None,
+    imap_host=None,
+    imap_port=None,
+    max_count=50,
+    max_workers=4,
+):
+    """
+    List several folders concurrently. Returns {folder: [emails as in check_mailbox]}.
+
+    Folders are spread over up to max_workers pooled connections, each scanning its
+    share in turn, so wall time is roughly that of the slowest share.
+    """
+    folders = list(folders)
+    workers = max(1, min(max_workers, len(folders)))
+
+    def scan(worker):
+        imap = _imap_connection(user=user, password=password, imap_host=imap_host, imap_port=imap_port)
+        try:
+            return {f: _list_folder(imap, f, max_count) for f in folders[worker::workers]}
+        except Exception:
+            _imap_pool.discard(imap)
+            raise
+        finally:
+            _imap_pool.release(imap)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        found = {}
+        for share in pool.map(scan, range(workers)):
+            found.update(share)
+    return {f: found[f] for f in folders}
 
 
 def open_mail(
@@ -184,42 +613,58 @@ def open_mail(
     """
     imap = _imap_connection(user=user, password=password, imap_host=imap_host, imap_port=imap_port)
     try:
-        imap.select(folder, readonly=True)
-        status, msg_data = imap.uid("fetch", str(uid).encode(), "(RFC822)")
-        if status != "OK" or not msg_data:
-            return None
-        for part in msg_data:
-            if isinstance(part, tuple) and len(part) > 1:
-                raw = part[1]
-                break
-        else:
-            raw = msg_data[0] if msg_data else None
-        if not raw:
-            return None
-        msg = email.message_from_bytes(raw)
-        subject = email.header.decode_header(msg.get("Subject", ""))
-        subj_str = "".join(
-            s.decode(enc or "utf-8", errors="replace") if isinstance(s, bytes) else (s or "")
-            for s, enc in subject
-        )
-        from_h = email.header.decode_header(msg.get("From", ""))
-        from_str = "".join(
-            s.decode(enc or "utf-8", errors="replace") if isinstance(s, bytes) else (s or "")
-            for s, enc in from_h
+        _imap_pool.select(imap, folder, readonly=True)
+        uid_bytes = str(uid).encode()
+        # First round trip: structure plus display headers, so attachments are never downloaded.
+        status, msg_data = imap.uid(
+            "fetch", uid_bytes, "(BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)])"
         )
+        if status != "OK" or not msg_data or msg_data[0] is None:
+            return None
+        items = _fetch_items(msg_data, uid)
+        header = next((v for k, v in items.items() if k.startswith(b"BODY[HEADER")), None)
+        structure = items.get(b"BODYSTRUCTURE")
+        text_parts = _find_text_parts(structure)
         body_plain = ""
         body_html = ""
-        if msg.is_multipart():
-            for part in msg.walk():
-                ctype = part.get_content_type()
-                if ctype == "text/plain":
-                    body_plain = part.get_payload(decode=True).decode(errors="replace")
-                elif ctype == "text/html":
-                    body_html = part.get_payload(decode=True).decode(errors="replace")
+        if header is not None and isinstance(structure, list):
+            msg = _header_parser.parsebytes(header)
+            if text_parts:
+                spec = " ".join("BODY.PEEK[%s]" % section for section, _, _ in text_parts.values())
+                status, part_data = imap.uid("fetch", uid_bytes, "(%s)" % spec)
+                if status != "OK" or not part_data or part_data[0] is None:
+                    return None
+                parts = _fetch_items(part_data, uid)
+                for ctype, (section, encoding, charset) in text_parts.items():
+                    data = parts.get(("BODY[%s]" % section).encode())
+                    if not data:
+                        continue
+                    if ctype == "text/plain":
+                        body_plain = _decode_part(data, encoding, charset)
+                    else:
+                        body_html = _decode_part(data, encoding, charset)
         else:
-            payload = msg.get_payload(decode=True)
-            if payload:
-                body_plain = payload.decode(errors="replace")
+            # No usable BODYSTRUCTURE: fall back to the whole message.
+            status, msg_data = imap.uid("fetch", uid_bytes, "(BODY.PEEK[])")
+            if status != "OK" or not msg_data:
+                return None
+            for part in msg_data:
+                if isinstance(part, tuple) and len(part) > 1:
+                    raw = part[1]
+                    break
+            else:
+                raw = msg_data[0] if msg_data else None
+            if not raw:
+                return None
+            msg = email.message_from_bytes(raw)
+            if msg.is_multipart():
+                body_plain, body_html = _text_bodies(msg)
+            else:
+                payload = msg.get_payload(decode=True)
+                if payload:
+                    body_plain = payload.decode(errors="replace")
+        subj_str = _decode_header(msg.get("Subject", ""))
+        from_str = _decode_header(msg.get("From", ""))
         return {
             "uid": uid,
             "subject": subj_str,
@@ -228,12 +673,15 @@ def open_mail(
             "body_plain": body_plain,
             "body_html": body_html,
         }
+    except Exception:
+        _imap_pool.discard(imap)
+        raise
     finally:
-        imap.logout()
+        _imap_pool.release(imap)
 
 
 def mark_as_read(
-    uid,
+    uids,
     folder="INBOX",
     *,
     user=None,
@@ -241,14 +689,26 @@ def mark_as_read(
     imap_host=None,
     imap_port=None,
 ):
-    """Mark a single email (by UID) as read in the given folder."""
+    """
+    Mark one or more emails as read in the given folder.
+
+    uids: a single UID (str or int) or an iterable of UIDs; all are flagged in one STORE.
+    """
+    if isinstance(uids, (str, bytes, int)):
+        uids = [uids]
+    uid_arg = ",".join(u.decode() if isinstance(u, bytes) else str(u) for u in uids)
+    if not uid_arg:
+        return
     imap = _imap_connection(user=user, password=password, imap_host=imap_host, imap_port=imap_port)
     try:
-        imap.select(folder, readonly=False)
+        _imap_pool.select(imap, folder, readonly=False)
         # Use UID STORE so we update by UID (same as list/open); flags as string for imaplib
-        imap.uid("store", str(uid), "+FLAGS", r"(\Seen)")
+        imap.uid("store", uid_arg, "+FLAGS", r"(\Seen)")
+    except Exception:
+        _imap_pool.discard(imap)
+        raise
     finally:
-        imap.logout()
+        _imap_pool.release(imap)
 
 
 def main():
@@ -279,8 +739,8 @@ def main():
     p_open.add_argument("--folder", default="INBOX", help="Mailbox folder")
 
     # mark-read
-    p_mark = sub.add_parser("mark-read", help="Mark an email as read by UID")
-    p_mark.add_argument("uid", help="Email UID from list")
+    p_mark = sub.add_parser("mark-read", help="Mark emails as read by UID")
+    p_mark.add_argument("uid", nargs="+", help="Email UID(s) from list")
     p_mark.add_argument("--folder", default="INBOX", help="Mailbox folder")
 
     args = parser.parse_args()
@@ -346,7 +806,7 @@ def main():
                 imap_host=args.imap_host,
                 imap_port=args.imap_port,
             )
-            print("Marked UID", args.uid, "as read")
+            print("Marked UID", ", ".join(args.uid), "as read")
 
     except Exception as e:
         print(e, file=sys.stderr)
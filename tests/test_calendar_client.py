@@ -0,0 +1,237 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+import calendar_client
+
+
+class FakeEvent:
+    def __init__(self, component):
+        self.component = component
+
+
+class FakeCalendar:
+    url = "https://calendar.google.com/calendar/dav/me%40example.com/events/"
+
+    def __init__(self, components):
+        self.components = components
+        self.searches = []
+
+    def search(self, **kwargs):
+        self.searches.append(kwargs)
+        return [FakeEvent(c) for c in self.components]
+
+
+def _calendar():
+    return FakeCalendar([
+        {"summary": "One", "dtstart": date(2026, 1, 10), "dtend": date(2026, 1, 11)},
+        {"summary": "Two", "dtstart": date(2026, 1, 20), "dtend": date(2026, 1, 21)},
+    ])
+
+
+class CachedSearchTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_cache_ttl_zero_bypasses_cache(self):
+        path = os.path.join(self.tmp.name, "cache", "events.sqlite3")
+        cal = _calendar()
+        with mock.patch.object(calendar_client, "_EVENT_CACHE_PATH", path):
+            events = calendar_client._cached_search(
+                "u", cal, date(2026, 1, 1), date(2026, 2, 1), 10, False, 0
+            )
+        self.assertEqual([e["summary"] for e in events], ["One", "Two"])
+        self.assertEqual(len(cal.searches), 1)
+        self.assertFalse(os.path.exists(path))
+
+    def test_unwritable_cache_path_falls_back_to_search(self):
+        blocker = os.path.join(self.tmp.name, "not-a-dir")
+        with open(blocker, "w"):
+            pass
+        path = os.path.join(blocker, "events.sqlite3")
+        cal = _calendar()
+        with mock.patch.object(calendar_client, "_EVENT_CACHE_PATH", path):
+            events = calendar_client._cached_search(
+                "u", cal, date(2026, 1, 1), date(2026, 2, 1), 1, False, 60
+            )
+        self.assertEqual([e["summary"] for e in events], ["One"])
+        self.assertEqual(len(cal.searches), 1)
+
+    @unittest.skipUnless(calendar_client.icalendar, "icalendar not installed")
+    def test_hit_and_miss_return_lazy_events(self):
+        ical = calendar_client.icalendar
+        comp = ical.Event()
+        comp.add("summary", "Standup")
+        comp.add("dtstart", date(2026, 1, 10))
+        comp.add("dtend", date(2026, 1, 11))
+        cal = FakeCalendar([comp])
+        path = os.path.join(self.tmp.name, "events.sqlite3")
+        with mock.patch.object(calendar_client, "_EVENT_CACHE_PATH", path):
+            miss = calendar_client._cached_search(
+                "u", cal, date(2026, 1, 1), date(2026, 2, 1), 10, False, 60
+            )
+            hit = calendar_client._cached_search(
+                "u", cal, date(2026, 1, 5), date(2026, 1, 15), 10, False, 60
+            )
+        self.assertEqual(len(cal.searches), 1)
+        self.assertIs(type(miss[0]), calendar_client._LazyEvent)
+        self.assertIs(type(hit[0]), calendar_client._LazyEvent)
+        self.assertEqual(dict(hit[0]), dict(miss[0]))
+
+
+@unittest.skipUnless(
+    calendar_client.icalendar and calendar_client.rrulestr, "icalendar/dateutil not installed"
+)
+class RecurrenceTests(unittest.TestCase):
+    def _master(self, rrule_lines, dtstart="20260105T100000Z", dtend="20260105T110000Z", extra=()):
+        text = (
+            "BEGIN:VEVENT\r\nUID:r1\r\nSUMMARY:Weekly\r\n"
+            "DTSTART:%s\r\nDTEND:%s\r\n%s%sEND:VEVENT\r\n"
+            % (
+                dtstart,
+                dtend,
+                "".join("RRULE:%s\r\n" % r for r in rrule_lines),
+                "".join("%s\r\n" % line for line in extra),
+            )
+        )
+        return calendar_client.icalendar.Event.from_ical(text)
+
+    def test_multiple_rrule_lines_are_expanded(self):
+        cal = FakeCalendar([self._master(["FREQ=WEEKLY;BYDAY=MO", "FREQ=WEEKLY;BYDAY=WE"])])
+        events = calendar_client._search_calendar(
+            cal, date(2026, 3, 1), date(2026, 3, 8), None, False
+        )
+        self.assertEqual([e["start"].day for e in events], [2, 4])
+        self.assertEqual(len(cal.searches), 1)
+
+    def test_unsupported_rule_falls_back_to_server_expansion(self):
+        # UNTIL without Z while DTSTART is UTC: dateutil rejects the rule.
+        cal = FakeCalendar([self._master(["FREQ=WEEKLY;UNTIL=20261231T000000"])])
+        calendar_client._search_calendar(cal, date(2026, 3, 1), date(2026, 3, 8), None, False)
+        self.assertEqual([s["expand"] for s in cal.searches], [False, True])
+
+    def test_rdate_only_event_is_expanded(self):
+        cal = FakeCalendar([self._master([], extra=["RDATE:20260302T100000Z"])])
+        events = calendar_client._search_calendar(
+            cal, date(2026, 3, 1), date(2026, 3, 8), None, False
+        )
+        self.assertEqual([(e["start"].month, e["start"].day) for e in events], [(3, 2)])
+
+    def test_rdate_is_added_to_rrule(self):
+        cal = FakeCalendar([
+            self._master(["FREQ=MONTHLY;BYMONTHDAY=5"], extra=["RDATE:20260302T100000Z"])
+        ])
+        events = calendar_client._search_calendar(
+            cal, date(2026, 3, 1), date(2026, 3, 8), None, False
+        )
+        self.assertEqual([e["start"].day for e in events], [2, 5])
+
+    def test_exrule_falls_back_to_server_expansion(self):
+        cal = FakeCalendar([self._master(["FREQ=WEEKLY"], extra=["EXRULE:FREQ=MONTHLY"])])
+        calendar_client._search_calendar(cal, date(2026, 3, 1), date(2026, 3, 8), None, False)
+        self.assertEqual([s["expand"] for s in cal.searches], [False, True])
+
+
+class FakeDAVError(Exception):
+    pass
+
+
+class FakeNotFound(FakeDAVError):
+    pass
+
+
+class FakeAuthorizationError(FakeDAVError):
+    pass
+
+
+class FailingCalendar(FakeCalendar):
+    def __init__(self, error):
+        super().__init__([])
+        self.error = error
+
+    def search(self, **kwargs):
+        raise self.error
+
+
+class SearchByIdTests(unittest.TestCase):
+    def setUp(self):
+        self.direct = {}
+        self.discovered = []
+        patches = [
+            mock.patch.object(calendar_client, "DAVError", FakeDAVError),
+            mock.patch.object(calendar_client, "AuthorizationError", FakeAuthorizationError),
+            mock.patch.object(calendar_client, "_credentials", return_value=("u", "p")),
+            mock.patch.object(
+                calendar_client, "_direct_calendar",
+                side_effect=lambda u, p, cid: self.direct[cid],
+            ),
+            mock.patch.object(
+                calendar_client, "_get_principal",
+                side_effect=lambda u, p: (None, None, self.discovered),
+            ),
+            mock.patch.object(calendar_client, "_calendar_by_id", {}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _list_all(self, calendar_ids, **kwargs):
+        return calendar_client.list_events_all(
+            date(2026, 1, 1), date(2026, 2, 1), calendar_ids, cache_ttl=0, **kwargs
+        )
+
+    def test_unknown_calendar_is_skipped(self):
+        self.direct = {
+            "me@example.com": _calendar(),
+            "gone@example.com": FailingCalendar(FakeNotFound()),
+        }
+        events = self._list_all(["me@example.com", "gone@example.com"])
+        self.assertEqual([e["summary"] for e in events], ["One", "Two"])
+
+    def test_other_errors_propagate(self):
+        self.direct = {
+            "me@example.com": _calendar(),
+            "denied@example.com": FailingCalendar(PermissionError("401")),
+        }
+        with self.assertRaises(PermissionError):
+            self._list_all(["me@example.com", "denied@example.com"])
+
+    def test_auth_errors_propagate(self):
+        self.direct = {"me@example.com": FailingCalendar(FakeAuthorizationError())}
+        self.discovered = [_calendar()]
+        with self.assertRaises(FakeAuthorizationError):
+            calendar_client.list_events(
+                date(2026, 1, 1), date(2026, 2, 1), "me@example.com", cache_ttl=0
+            )
+
+    def test_rejected_direct_url_falls_back_to_discovery(self):
+        # e.g. a ReportError from a server that does not serve the id at that URL
+        self.direct = {"me@example.com": FailingCalendar(FakeDAVError("REPORT failed"))}
+        self.discovered = [_calendar()]
+        events = calendar_client.list_events(
+            date(2026, 1, 1), date(2026, 2, 1), "me@example.com", cache_ttl=0
+        )
+        self.assertEqual([e["summary"] for e in events], ["One", "Two"])
+
+    def test_partial_id_skips_direct_url(self):
+        self.discovered = [_calendar()]
+        events = self._list_all(["me%40example.com"])
+        self.assertEqual([e["summary"] for e in events], ["One", "Two"])
+
+    def test_expanded_results_are_sorted_before_trimming(self):
+        self.direct = {
+            "a@example.com": FakeCalendar([
+                {"summary": "Late", "dtstart": date(2026, 1, 30), "dtend": date(2026, 1, 31)},
+                {"summary": "Early", "dtstart": date(2026, 1, 2), "dtend": date(2026, 1, 3)},
+            ]),
+            "b@example.com": _calendar(),
+        }
+        events = self._list_all(["a@example.com", "b@example.com"], max_results=2, expand=True)
+        self.assertEqual([e["summary"] for e in events], ["Early", "One"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+
+import mail_client
+
+BODYSTRUCTURE = (
+    b'(("TEXT" "PLAIN" ("CHARSET" "UTF-8") NIL NIL "BASE64" 8 1 NIL NIL NIL)'
+    b'("APPLICATION" "PDF" NIL NIL NIL "BASE64" 99999 NIL ("ATTACHMENT" NIL) NIL)'
+    b' "MIXED" NIL NIL NIL)'
+)
+
+
+class FetchItemsTests(unittest.TestCase):
+    def test_skips_unsolicited_fetch_responses(self):
+        msg_data = [
+            b"3 (FLAGS (\\Seen))",
+            (
+                b"7 (UID 7 BODYSTRUCTURE " + BODYSTRUCTURE
+                + b" BODY[HEADER.FIELDS (SUBJECT FROM DATE)] {12}",
+                b"Subject: x\r\n",
+            ),
+            b")",
+        ]
+        items = mail_client._fetch_items(msg_data, 7)
+        self.assertEqual(items[b"UID"], b"7")
+        self.assertIn(b"BODYSTRUCTURE", items)
+        self.assertEqual(items[b"BODY[HEADER.FIELDS (SUBJECT FROM DATE)]"], b"Subject: x\r\n")
+
+    def test_unknown_uid_returns_empty(self):
+        self.assertEqual(mail_client._fetch_items([b"3 (UID 3 FLAGS ())"], 7), {})
+
+    def test_find_text_parts_skips_attachments(self):
+        items = mail_client._fetch_items([b"1 (UID 1 BODYSTRUCTURE " + BODYSTRUCTURE + b")"], 1)
+        self.assertEqual(
+            mail_client._find_text_parts(items[b"BODYSTRUCTURE"]),
+            {"text/plain": ("1", "base64", "UTF-8")},
+        )
+
+
+class FakeIMAP:
+    """Stand-in for _IMAP4_SSL: records commands and queues untagged responses."""
+
+    def __init__(self, exists=100):
+        self.exists = exists
+        self.untagged_responses = {}
+        self.mailbox_events = []
+        self.commands = []
+
+    def untagged(self, typ, dat):
+        self.untagged_responses.setdefault(typ, []).append(dat)
+        self.mailbox_events.append((typ, dat))
+
+    def select(self, folder, readonly=False):
+        self.commands.append(("select", folder))
+        self.untagged("EXISTS", str(self.exists).encode())
+        return "OK", [str(self.exists).encode()]
+
+    def fetch(self, message_set, spec):
+        self.commands.append(("fetch", message_set))
+        return "OK", [None]
+
+
+class IMAPPoolSelectTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = mail_client._IMAPPool()
+        self.imap = FakeIMAP(exists=100)
+
+    def test_select_is_cached(self):
+        self.assertEqual(self.pool.select(self.imap, "INBOX", True), 100)
+        self.assertEqual(self.pool.select(self.imap, "INBOX", True), 100)
+        self.assertEqual(self.imap.commands, [("select", "INBOX")])
+        self.assertEqual(self.imap.untagged_responses, {})
+
+    def test_expunges_after_select_lower_the_count(self):
+        self.pool.select(self.imap, "INBOX", True)
+        for seq in range(5):
+            self.imap.untagged("EXPUNGE", b"1")
+        self.assertEqual(self.pool.select(self.imap, "INBOX", True), 95)
+
+    def test_events_are_applied_in_order(self):
+        self.pool.select(self.imap, "INBOX", True)
+        self.imap.untagged("EXISTS", b"101")
+        self.imap.untagged("EXPUNGE", b"3")
+        self.imap.untagged("EXPUNGE", b"3")
+        self.assertEqual(self.pool.select(self.imap, "INBOX", True), 99)
+        self.imap.untagged("EXPUNGE", b"3")
+        self.imap.untagged("EXISTS", b"120")
+        self.assertEqual(self.pool.select(self.imap, "INBOX", True), 120)
+
+    def test_list_folder_fetches_the_last_messages(self):
+        with mock.patch.object(mail_client, "_imap_pool", self.pool):
+            mail_client._list_folder(self.imap, "INBOX", 20)
+            for seq in range(5):
+                self.imap.untagged("EXPUNGE", b"1")
+            mail_client._list_folder(self.imap, "INBOX", 20)
+        fetches = [c[1] for c in self.imap.commands if c[0] == "fetch"]
+        self.assertEqual(fetches, ["81:*", "76:*"])
+
+
+class PooledFakeIMAP(FakeIMAP):
+    def __init__(self, host, port, ssl_context=None):
+        super().__init__()
+        self.logged_out = False
+
+    def login(self, user, password):
+        pass
+
+    def noop(self):
+        self.commands.append(("noop",))
+
+    def logout(self):
+        self.logged_out = True
+
+
+class IMAPPoolAcquireTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = mail_client._IMAPPool()
+        self.pool.connection_class = PooledFakeIMAP
+
+    def test_connection_is_exclusive_until_released(self):
+        first = self.pool.acquire("u", "p", "h", 993)
+        second = self.pool.acquire("u", "p", "h", 993)
+        self.assertIsNot(first, second)
+        self.pool.release(first)
+        self.assertIs(self.pool.acquire("u", "p", "h", 993), first)
+        self.assertEqual(first.commands, [("noop",)])
+
+    def test_discarded_connection_is_not_reused(self):
+        first = self.pool.acquire("u", "p", "h", 993)
+        self.pool.discard(first)
+        self.pool.release(first)
+        self.assertTrue(first.logged_out)
+        self.assertIsNot(self.pool.acquire("u", "p", "h", 993), first)
+
+
+if __name__ == "__main__":
+    unittest.main()